@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import polars as pl
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -7,18 +8,22 @@ from plotly.subplots import make_subplots
 ################################################
 ###### CARGA, PREPROCESAMIENTO Y ANÁLISIS ######
 ################################################
+@st.cache_data(show_spinner=False)
 def cargar_datos():
-    df = pd.read_csv('./data/PresuntosSuicidios.csv', encoding='utf-8-sig')
+    # Columnas del conjunto de datos que se muestran o analizan en el dashboard
+    columnas = ['Año del hecho', 'Ciclo Vital', 'Sexo de la victima', 'Pais de Nacimiento',
+                'Departamento del hecho DANE', 'Escenario del Hecho',
+                'Mecanismo Causal de la Lesion Fatal', 'Razon del Suicidio']
+    
+    # Lectura del Parquet generado con convertir_a_parquet.py, que ya guarda los tipos
+    # (categorías ordenadas alfabéticamente); solo se leen las columnas indicadas
+    df = pd.read_parquet('./data/PresuntosSuicidios.parquet', columns=columnas)
     
     # Eliminar filas con valores nulos
     df_limpio = df.dropna()
     
-    # Asegurar que las columnas categóricas sean string
-    columnas_str = ['Departamento del hecho DANE', 'Ciclo Vital', 'Sexo de la victima', 
-                    'Escenario del Hecho', 'Mecanismo Causal de la Lesion Fatal', 'Razon del Suicidio']
-    
-    for col in columnas_str:
-        df_limpio[col] = df_limpio[col].astype(str)
+    # Sin nulos, el año pasa del entero anulable a int32
+    df_limpio['Año del hecho'] = df_limpio['Año del hecho'].astype('int32')
     
     return df_limpio
 
@@ -27,71 +32,486 @@ df = cargar_datos()
 ### CÁLCULOS GENERALES
 num_registros = len(df)
 num_columnas = len(df.columns)
-df_con_depto = df[df['Departamento del hecho DANE'] != 'Sin informacion']
-num_departamentos = df_con_depto['Departamento del hecho DANE'].nunique()
+col_depto = df['Departamento del hecho DANE']
+num_departamentos = col_depto[col_depto != 'Sin informacion'].nunique()
 num_anios = df['Año del hecho'].nunique()
 anio_min = int(df['Año del hecho'].min())
 anio_max = int(df['Año del hecho'].max())
 
-### ANÁLISIS POR CICLO VITAL
-df_ciclo = df['Ciclo Vital'].value_counts().reset_index()
-df_ciclo.columns = ['Ciclo Vital', 'Cantidad']
+### AGREGACIONES ESTÁTICAS
+# Solo dependen de los datos cargados, por lo que se calculan una vez y se reutilizan entre recargas.
+# El guion bajo en `_df` evita que Streamlit calcule el hash del DataFrame completo.
+@st.cache_data(show_spinner=False)
+def calcular_agregados(_df):
+    df = _df
+
+    # Conteos de frecuencia de todas las columnas, una pasada por columna
+    columnas_conteo = ['Ciclo Vital', 'Sexo de la victima', 'Escenario del Hecho',
+                       'Mecanismo Causal de la Lesion Fatal', 'Razon del Suicidio']
+    conteos = {col: df[col].value_counts() for col in columnas_conteo}
+
+    ### ANÁLISIS POR CICLO VITAL
+    df_ciclo = conteos['Ciclo Vital'].reset_index()
+    df_ciclo.columns = ['Ciclo Vital', 'Cantidad']
+
+    ### ANÁLISIS POR GÉNERO
+    df_genero = conteos['Sexo de la victima'].reset_index()
+    df_genero.columns = ['Sexo', 'Cantidad']
+    df_genero['Porcentaje'] = (df_genero['Cantidad'] / df_genero['Cantidad'].sum() * 100).round(1)
+
+    ### ANÁLISIS POR GÉNERO Y CICLO VITAL
+    df_genero_ciclo = df.groupby(['Ciclo Vital', 'Sexo de la victima'], observed=True).size().reset_index(name='Cantidad')
+
+    ### ANÁLISIS TEMPORAL
+    df_temporal = df.groupby('Año del hecho').size().reset_index(name='Cantidad')
+    df_temporal = df_temporal.sort_values('Año del hecho')
+
+    # Calcular indicadores para años específicos
+    años_indicadores = [2021, 2022, 2023, 2024]
+    serie_temporal = df_temporal.set_index('Año del hecho')['Cantidad']
+    indicadores = {año: int(serie_temporal.get(año, 0)) for año in años_indicadores}
+
+    # Calcular deltas (variación respecto al año anterior; 0 si no hay base de comparación)
+    serie_indicadores = pd.Series(indicadores)
+    deltas = (
+        serie_indicadores.pct_change()
+        .replace(float('inf'), 0)
+        .fillna(0)
+        .to_dict()
+    )
 
-### ANÁLISIS POR GÉNERO
-df_genero = df['Sexo de la victima'].value_counts().reset_index()
-df_genero.columns = ['Sexo', 'Cantidad']
-df_genero['Porcentaje'] = (df_genero['Cantidad'] / df_genero['Cantidad'].sum() * 100).round(1)
+    ### ANÁLISIS POR DEPARTAMENTO Y AÑO
+    df_depto_anio = df.groupby(['Departamento del hecho DANE', 'Año del hecho'], observed=True).size().reset_index(name='Cantidad')
+    # Separar por departamento para que el selector haga una búsqueda directa
+    depto_anio_por_depto = {
+        depto: df_grupo.reset_index(drop=True)
+        for depto, df_grupo in df_depto_anio.groupby('Departamento del hecho DANE', observed=True)
+    }
+
+    ### ANÁLISIS DE ESCENARIOS
+    df_escenario = conteos['Escenario del Hecho'].head(10).reset_index()
+    df_escenario.columns = ['Escenario', 'Cantidad']
+
+    ### ANÁLISIS DE MECANISMOS
+    df_mecanismo = conteos['Mecanismo Causal de la Lesion Fatal'].head(10).reset_index()
+    df_mecanismo.columns = ['Mecanismo', 'Cantidad']
+
+    ### ANÁLISIS DE RAZONES
+    # Un único conteo sirve para ambas tablas
+    conteo_razones = conteos['Razon del Suicidio']
+    df_razones = conteo_razones.head(10).rename_axis('Razón').reset_index(name='Cantidad')
+
+    # Filtrar "Sin informacion" si está en el top
+    df_razones_filtrado = (
+        conteo_razones.drop('Sin informacion', errors='ignore')
+        .head(10)
+        .rename_axis('Razón')
+        .reset_index(name='Cantidad')
+    )
 
-### ANÁLISIS POR GÉNERO Y CICLO VITAL
-df_genero_ciclo = df.groupby(['Ciclo Vital', 'Sexo de la victima']).size().reset_index(name='Cantidad')
+    return {
+        'df_ciclo': df_ciclo,
+        'df_genero': df_genero,
+        'df_genero_ciclo': df_genero_ciclo,
+        'df_temporal': df_temporal,
+        'indicadores': indicadores,
+        'deltas': deltas,
+        'depto_anio_por_depto': depto_anio_por_depto,
+        'df_escenario': df_escenario,
+        'df_mecanismo': df_mecanismo,
+        'df_razones': df_razones,
+        'df_razones_filtrado': df_razones_filtrado,
+    }
+
+agregados = calcular_agregados(df)
+df_ciclo = agregados['df_ciclo']
+df_genero = agregados['df_genero']
+df_genero_ciclo = agregados['df_genero_ciclo']
+df_temporal = agregados['df_temporal']
+indicadores = agregados['indicadores']
+deltas = agregados['deltas']
+depto_anio_por_depto = agregados['depto_anio_por_depto']
+df_escenario = agregados['df_escenario']
+df_mecanismo = agregados['df_mecanismo']
+df_razones = agregados['df_razones']
+df_razones_filtrado = agregados['df_razones_filtrado']
+
+### CONTEOS DE RAZONES POR CICLO VITAL Y GÉNERO
+# Se precalculan todas las combinaciones para que los filtros de la pregunta 5
+# solo tengan que seleccionar filas de una tabla pequeña. La agrupación se hace
+# en Polars (multihilo) y solo el resultado, de pocas filas, vuelve a pandas
+@st.cache_data(show_spinner=False)
+def calcular_conteos_razones(_df):
+    columnas = ['Ciclo Vital', 'Sexo de la victima', 'Razon del Suicidio']
+    
+    conteos = (
+        pl.from_pandas(_df[columnas])
+        .lazy()
+        .group_by(columnas)
+        .len()
+        .with_columns(pl.col(columnas).cast(pl.String))
+        .collect()
+        .to_pandas()
+    )
+    
+    return conteos.set_index(columnas)['len'].sort_index()
 
-### ANÁLISIS TEMPORAL
-df_temporal = df.groupby('Año del hecho').size().reset_index(name='Cantidad')
-df_temporal = df_temporal.sort_values('Año del hecho')
+conteos_razones = calcular_conteos_razones(df)
 
-# Calcular indicadores para años específicos
-años_indicadores = [2021, 2022, 2023, 2024]
-indicadores = {}
-deltas = {}
+# Máscaras booleanas precalculadas por valor de cada filtro, a partir de los códigos
+# enteros del índice; filtrar se reduce a combinar arreglos ya existentes
+@st.cache_data(show_spinner=False)
+def calcular_mascaras(_conteos, nivel):
+    posicion = _conteos.index.names.index(nivel)
+    codigos = _conteos.index.codes[posicion]
+    return {valor: codigos == i for i, valor in enumerate(_conteos.index.levels[posicion])}
 
-for año in años_indicadores:
-    if año in df_temporal['Año del hecho'].values:
-        indicadores[año] = int(df_temporal[df_temporal['Año del hecho'] == año]['Cantidad'].values[0])
-    else:
-        indicadores[año] = 0
-
-# Calcular deltas
-for i, año in enumerate(años_indicadores):
-    if i > 0:
-        año_anterior = años_indicadores[i-1]
-        if indicadores[año_anterior] > 0:
-            deltas[año] = ((indicadores[año] - indicadores[año_anterior]) / indicadores[año_anterior])
-        else:
-            deltas[año] = 0
-    else:
-        deltas[año] = 0
+mascaras_ciclo = calcular_mascaras(conteos_razones, 'Ciclo Vital')
+mascaras_genero = calcular_mascaras(conteos_razones, 'Sexo de la victima')
 
-### ANÁLISIS POR DEPARTAMENTO Y AÑO
-df_depto_anio = df.groupby(['Departamento del hecho DANE', 'Año del hecho']).size().reset_index(name='Cantidad')
+### LISTA DE DEPARTAMENTOS
 # Eliminar valores NaN y ordenar
 lista_deptos = df['Departamento del hecho DANE'].dropna().unique().tolist()
 lista_deptos.sort()
 
-### ANÁLISIS DE ESCENARIOS
-df_escenario = df['Escenario del Hecho'].value_counts().head(10).reset_index()
-df_escenario.columns = ['Escenario', 'Cantidad']
+### LISTA DE CICLOS VITALES
+# Las categorías ya están ordenadas alfabéticamente desde la carga
+lista_ciclos = df['Ciclo Vital'].cat.categories.tolist()
+
+
+################################################
+################### GRÁFICOS ###################
+################################################
+# Las figuras se guardan con st.cache_resource, que devuelve el mismo objeto sin
+# copiarlo ni calcular hashes de DataFrames: los parámetros con guion bajo no forman
+# parte de la clave, así que las figuras estáticas se construyen una sola vez y las
+# dependientes de filtros se identifican solo por los valores seleccionados
+
+# Sin barra de herramientas de Plotly: se evita su inicialización en cada gráfico
+CONFIG_GRAFICOS = {'displayModeBar': False, 'responsive': True}
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_ciclo(_df_ciclo):
+    fig_ciclo = go.Figure()
+
+    fig_ciclo.add_trace(go.Bar(
+        y=_df_ciclo['Ciclo Vital'],
+        x=_df_ciclo['Cantidad'],
+        orientation='h',
+        text=_df_ciclo['Cantidad'],
+        textposition='auto',
+        marker_color='#3498db',
+        hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
+    ))
+
+    fig_ciclo.update_layout(
+        title='Distribución de Casos por Ciclo Vital',
+        xaxis_title='Número de Casos',
+        yaxis_title='',
+        height=400,
+        yaxis={'categoryorder': 'total ascending'},
+        showlegend=False
+    )
+
+    return fig_ciclo
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_pie_ciclo(_df_ciclo):
+    fig_pie_ciclo = go.Figure(data=[go.Pie(
+        labels=_df_ciclo['Ciclo Vital'],
+        values=_df_ciclo['Cantidad'],
+        hole=0.4,
+        marker_colors=['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6']
+    )])
+
+    fig_pie_ciclo.update_layout(
+        title='Proporción por Ciclo Vital',
+        height=400
+    )
+
+    return fig_pie_ciclo
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_genero(_df_genero):
+    fig_genero = go.Figure()
+
+    fig_genero.add_trace(go.Bar(
+        x=_df_genero['Sexo'],
+        y=_df_genero['Cantidad'],
+        text=_df_genero['Cantidad'],
+        textposition='auto',
+        marker_color=['#3498db', '#e74c3c'],
+        hovertemplate='<b>%{x}</b><br>Casos: %{y}<br>Porcentaje: %{customdata}%<extra></extra>',
+        customdata=_df_genero['Porcentaje']
+    ))
+
+    fig_genero.update_layout(
+        title='Distribución de Casos por Género',
+        xaxis_title='Género',
+        yaxis_title='Número de Casos',
+        height=400,
+        showlegend=False
+    )
+
+    return fig_genero
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_genero_ciclo(_df_genero_ciclo):
+    fig_genero_ciclo = px.bar(
+        _df_genero_ciclo,
+        x='Ciclo Vital',
+        y='Cantidad',
+        color='Sexo de la victima',
+        title='Distribución por Género y Ciclo Vital',
+        barmode='group',
+        color_discrete_map={'Hombre': '#3498db', 'Mujer': '#e74c3c'},
+        height=400
+    )
+
+    fig_genero_ciclo.update_layout(
+        xaxis_title='Ciclo Vital',
+        yaxis_title='Número de Casos',
+        legend_title='Género'
+    )
+
+    return fig_genero_ciclo
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_temporal(_df_temporal):
+    fig_temporal = go.Figure()
+
+    fig_temporal.add_trace(go.Scattergl(
+        x=_df_temporal['Año del hecho'],
+        y=_df_temporal['Cantidad'],
+        mode='lines+markers',
+        line=dict(color='#e74c3c', width=3),
+        marker=dict(size=10),
+        name='Casos por año',
+        hovertemplate='<b>Año %{x}</b><br>Casos: %{y}<extra></extra>'
+    ))
+
+    fig_temporal.update_layout(
+        title='Evolución Temporal de Casos de Suicidio (2015-2024)',
+        xaxis_title='Año',
+        yaxis_title='Número de Casos',
+        height=400,
+        hovermode='x unified'
+    )
+
+    return fig_temporal
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_depto(_df_depto_filtrado, depto_seleccionado):
+    fig_depto = go.Figure()
+
+    fig_depto.add_trace(go.Bar(
+        x=_df_depto_filtrado['Año del hecho'],
+        y=_df_depto_filtrado['Cantidad'],
+        marker_color='#3498db',
+        text=_df_depto_filtrado['Cantidad'],
+        textposition='auto',
+        hovertemplate='<b>%{x}</b><br>Casos: %{y}<extra></extra>'
+    ))
+
+    fig_depto.update_layout(
+        title=f'Evolución en {depto_seleccionado}',
+        xaxis_title='Año',
+        yaxis_title='Número de Casos',
+        height=400,
+        showlegend=False
+    )
 
-### ANÁLISIS DE MECANISMOS
-df_mecanismo = df['Mecanismo Causal de la Lesion Fatal'].value_counts().head(10).reset_index()
-df_mecanismo.columns = ['Mecanismo', 'Cantidad']
+    return fig_depto
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_escenario(_df_escenario):
+    fig_escenario = go.Figure()
+
+    fig_escenario.add_trace(go.Bar(
+        y=_df_escenario['Escenario'],
+        x=_df_escenario['Cantidad'],
+        orientation='h',
+        text=_df_escenario['Cantidad'],
+        textposition='auto',
+        marker_color='#2ecc71',
+        hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
+    ))
+
+    fig_escenario.update_layout(
+        xaxis_title='Número de Casos',
+        yaxis_title='',
+        height=500,
+        yaxis={'categoryorder': 'total ascending'},
+        showlegend=False
+    )
+
+    return fig_escenario
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_mecanismo(_df_mecanismo):
+    fig_mecanismo = go.Figure()
+
+    fig_mecanismo.add_trace(go.Bar(
+        y=_df_mecanismo['Mecanismo'],
+        x=_df_mecanismo['Cantidad'],
+        orientation='h',
+        text=_df_mecanismo['Cantidad'],
+        textposition='auto',
+        marker_color='#e67e22',
+        hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
+    ))
+
+    fig_mecanismo.update_layout(
+        xaxis_title='Número de Casos',
+        yaxis_title='',
+        height=500,
+        yaxis={'categoryorder': 'total ascending'},
+        showlegend=False
+    )
 
-### ANÁLISIS DE RAZONES
-df_razones = df['Razon del Suicidio'].value_counts().head(10).reset_index()
-df_razones.columns = ['Razón', 'Cantidad']
+    return fig_mecanismo
+
+@st.cache_resource(show_spinner=False)
+def construir_fig_razones(_df_razones_dinamico, ciclo_seleccionado, genero_seleccionado, incluir_sin_info):
+    fig_razones = go.Figure()
+
+    fig_razones.add_trace(go.Bar(
+        y=_df_razones_dinamico['Razón'],
+        x=_df_razones_dinamico['Cantidad'],
+        orientation='h',
+        text=_df_razones_dinamico['Cantidad'],
+        textposition='auto',
+        marker_color='#9b59b6',
+        hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
+    ))
+
+    fig_razones.update_layout(
+        xaxis_title='Número de Casos',
+        yaxis_title='',
+        height=500,
+        yaxis={'categoryorder': 'total ascending'},
+        showlegend=False
+    )
+
+    return fig_razones
+
+################################################
+############### TEXTOS ESTÁTICOS ###############
+################################################
+# Contenido fijo del dashboard, definido una sola vez a nivel de módulo
+
+ESTILOS_CSS = '''
+<style>
+    .block-container {
+        max-width: 1400px;
+        padding-top: 2rem;
+    }
+    .stMetric {
+        background-color: #000;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    h1 {
+        color: #1f77b4;
+    }
+    h2 {
+        color: #2c3e50;
+        border-bottom: 2px solid #1f77b4;
+        padding-bottom: 10px;
+    }
+    [data-testid="stMarkdownContainer"] p,
+    [data-testid="stHtml"] p {
+        font-size: 1.2rem !important;
+    }
+    h3 {
+        color: #34495e;
+    }
+</style>
+'''
+
+INTRODUCCION_MD = """
+#### Contexto
+
+El suicidio es un problema de salud pública que afecta a comunidades en todo el mundo. En Colombia, 
+comprender los patrones, tendencias y factores asociados a estos casos es fundamental para el diseño 
+de políticas públicas efectivas de prevención.
+
+#### Objetivos del Análisis
+
+Este dashboard interactivo tiene como propósito:
+- Identificar los grupos poblacionales más vulnerables
+- Analizar la variabilidad de los hechos en el transcurso de los años
+- Determinar los escenarios y mecanismos más frecuentes
+- Comprender los principales factores asociados
+
+#### Alcance
+
+- **Temporal:** 2015 - 2024 (9 años)
+- **Geográfico:** Todo el territorio colombiano
+- **Fuente:** Datos oficiales procesados y limpiados
+"""
+
+CONCLUSIONES_MD = """
+### Hallazgos Principales
+
+1. **Grupos más vulnerables:**
+   - Los adultos (29-59 años) representan el grupo etario con mayor número de casos
+   - Los hombres tienen una prevalencia 3.3 veces mayor que las mujeres
+
+2. **Tendencia temporal:**
+   - Se observa un incremento sostenido en el período 2015-2024
+   - Los años recientes (2022-2024) muestran los valores más altos del período analizado
+
+3. **Patrones de ocurrencia:**
+   - La vivienda es el escenario más frecuente de los casos
+   - Los generadores de asfixia constituyen el mecanismo más utilizado
+
+4. **Factores asociados:**
+   - Los conflictos de pareja y las enfermedades mentales son los motivos más reportados
+   - Existe una alta proporción de casos sin información sobre la razón (desafío para prevención)
+
+### Recomendaciones
+
+1. **Fortalecimiento de sistemas de información:** Mejorar el registro de información sobre 
+   las razones asociadas a cada caso
+
+2. **Programas de prevención focalizados:** Diseñar estrategias específicas para hombres adultos 
+   y jóvenes, que son los grupos más vulnerables
+
+3. **Atención en salud mental:** Fortalecer los servicios de atención psicológica y psiquiátrica, 
+   especialmente en casos de conflictos de pareja y enfermedades mentales
+
+4. **Vigilancia epidemiológica:** Mantener sistemas de monitoreo continuo que permitan detectar 
+   cambios en las tendencias y patrones
+
+5. **Intervención en crisis:** Implementar líneas de atención telefónica y servicios de 
+   intervención en crisis disponibles 24/7
+
+### Limitaciones del Estudio
+
+- El 43% de los registros originales fueron excluidos por falta de información completa
+- La alta proporción de casos "sin información" en la razón del suicidio limita el análisis causal
+- Los datos corresponden a casos reportados oficialmente, pudiendo existir subregistro
+
+### Recursos de Ayuda
+
+**Si tú o alguien que conoces está atravesando una crisis:**
+- 📞 Línea Nacional: 106 (Línea de atención en salud mental)
+- 📞 Línea de la Vida: 01 8000 113 113
+"""
+
+PIE_DE_PAGINA_HTML = """
+<div style='text-align: center; color: #7f8c8d; padding: 20px;'>
+    <p>Dashboard desarrollado para análisis epidemiológico de suicidios en Colombia</p>
+    <p>Datos: 2015-2024 | Fuente: Instituto Nacional de Medicina Legal y Ciencias Forenses</p>
+    <p><em>Este análisis tiene fines académicos y de investigación en salud pública</em></p>
+    <p>Integrantes del Equipo:</p>
+    <p><em>* Mauricio Urrego Ospina</em></p>
+    <p><em>* Juliana Andrea Urrego Madrid</em></p>
+    <p><em>* Paula Andrea Gallego Higinio</em></p>
+</div>
+"""
 
-# Filtrar "Sin informacion" si está en el top
-df_razones_filtrado = df[df['Razon del Suicidio'] != 'Sin informacion']['Razon del Suicidio'].value_counts().head(10).reset_index()
-df_razones_filtrado.columns = ['Razón', 'Cantidad']
 
 ################################################
 ################# VISUALIZACIÓN ################
@@ -105,62 +525,14 @@ st.set_page_config(
 )
 
 # CSS personalizado
-st.markdown(
-    '''
-    <style>
-        .block-container {
-            max-width: 1400px;
-            padding-top: 2rem;
-        }
-        .stMetric {
-            background-color: #000;
-            padding: 10px;
-            border-radius: 5px;
-        }
-        h1 {
-            color: #1f77b4;
-        }
-        h2 {
-            color: #2c3e50;
-            border-bottom: 2px solid #1f77b4;
-            padding-bottom: 10px;
-        }
-         [data-testid="stMarkdownContainer"] p {
-            font-size: 1.2rem !important;
-        }
-        h3 {
-            color: #34495e;
-        }
-    </style>
-    ''', unsafe_allow_html=True
-)
+st.html(ESTILOS_CSS)
 
 ##############  INTRODUCCIÓN  ##############
 st.title('Colombia y el Suicidio: Comportamiento y Determinantes')
 st.markdown('### Período 2015-2024')
 
 with st.container(border=True):
-    st.markdown("""
-    #### Contexto
-    
-    El suicidio es un problema de salud pública que afecta a comunidades en todo el mundo. En Colombia, 
-    comprender los patrones, tendencias y factores asociados a estos casos es fundamental para el diseño 
-    de políticas públicas efectivas de prevención.
-    
-    #### Objetivos del Análisis
-    
-    Este dashboard interactivo tiene como propósito:
-    - Identificar los grupos poblacionales más vulnerables
-    - Analizar la variabilidad de los hechos en el transcurso de los años
-    - Determinar los escenarios y mecanismos más frecuentes
-    - Comprender los principales factores asociados
-    
-    #### Alcance
-    
-    - **Temporal:** 2015 - 2024 (9 años)
-    - **Geográfico:** Todo el territorio colombiano
-    - **Fuente:** Datos oficiales procesados y limpiados
-    """)
+    st.markdown(INTRODUCCION_MD)
 
 st.markdown("---")
 
@@ -208,44 +580,15 @@ with st.container(border=True):
     
     with col1:
         # Gráfico de barras horizontales
-        fig_ciclo = go.Figure()
-        
-        fig_ciclo.add_trace(go.Bar(
-            y=df_ciclo['Ciclo Vital'],
-            x=df_ciclo['Cantidad'],
-            orientation='h',
-            text=df_ciclo['Cantidad'],
-            textposition='auto',
-            marker_color='#3498db',
-            hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
-        ))
+        fig_ciclo = construir_fig_ciclo(df_ciclo)
         
-        fig_ciclo.update_layout(
-            title='Distribución de Casos por Ciclo Vital',
-            xaxis_title='Número de Casos',
-            yaxis_title='',
-            height=400,
-            yaxis={'categoryorder': 'total ascending'},
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig_ciclo, use_container_width=True)
+        st.plotly_chart(fig_ciclo, use_container_width=True, config=CONFIG_GRAFICOS)
     
     with col2:
         # Gráfico de pie
-        fig_pie_ciclo = go.Figure(data=[go.Pie(
-            labels=df_ciclo['Ciclo Vital'],
-            values=df_ciclo['Cantidad'],
-            hole=0.4,
-            marker_colors=['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6']
-        )])
-        
-        fig_pie_ciclo.update_layout(
-            title='Proporción por Ciclo Vital',
-            height=400
-        )
+        fig_pie_ciclo = construir_fig_pie_ciclo(df_ciclo)
         
-        st.plotly_chart(fig_pie_ciclo, use_container_width=True)
+        st.plotly_chart(fig_pie_ciclo, use_container_width=True, config=CONFIG_GRAFICOS)
     
     # Insight
     ciclo_mayor = df_ciclo.iloc[0]['Ciclo Vital']
@@ -266,48 +609,15 @@ with st.container(border=True):
     
     with col1:
         # Gráfico de barras comparativo
-        fig_genero = go.Figure()
-        
-        fig_genero.add_trace(go.Bar(
-            x=df_genero['Sexo'],
-            y=df_genero['Cantidad'],
-            text=df_genero['Cantidad'],
-            textposition='auto',
-            marker_color=['#3498db', '#e74c3c'],
-            hovertemplate='<b>%{x}</b><br>Casos: %{y}<br>Porcentaje: %{customdata}%<extra></extra>',
-            customdata=df_genero['Porcentaje']
-        ))
+        fig_genero = construir_fig_genero(df_genero)
         
-        fig_genero.update_layout(
-            title='Distribución de Casos por Género',
-            xaxis_title='Género',
-            yaxis_title='Número de Casos',
-            height=400,
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig_genero, use_container_width=True)
+        st.plotly_chart(fig_genero, use_container_width=True, config=CONFIG_GRAFICOS)
     
     with col2:
         # Análisis por género y ciclo vital
-        fig_genero_ciclo = px.bar(
-            df_genero_ciclo,
-            x='Ciclo Vital',
-            y='Cantidad',
-            color='Sexo de la victima',
-            title='Distribución por Género y Ciclo Vital',
-            barmode='group',
-            color_discrete_map={'Hombre': '#3498db', 'Mujer': '#e74c3c'},
-            height=400
-        )
+        fig_genero_ciclo = construir_fig_genero_ciclo(df_genero_ciclo)
         
-        fig_genero_ciclo.update_layout(
-            xaxis_title='Ciclo Vital',
-            yaxis_title='Número de Casos',
-            legend_title='Género'
-        )
-        
-        st.plotly_chart(fig_genero_ciclo, use_container_width=True)
+        st.plotly_chart(fig_genero_ciclo, use_container_width=True, config=CONFIG_GRAFICOS)
     
     # Métricas comparativas
     col3, col4, col5 = st.columns(3)
@@ -333,6 +643,22 @@ with st.container(border=True):
 
 ##############  PREGUNTA 3: EVOLUCIÓN TEMPORAL  ##############
 
+@st.fragment
+def seccion_departamento(depto_anio_por_depto, lista_deptos):
+    st.subheader('Comportamiento por Departamento')
+    
+    depto_seleccionado = st.selectbox(
+        'Seleccione un Departamento:',
+        options=lista_deptos,
+        index=lista_deptos.index('Antioquia') if 'Antioquia' in lista_deptos else 0
+    )
+    
+    df_depto_filtrado = depto_anio_por_depto[depto_seleccionado]
+    
+    fig_depto = construir_fig_depto(df_depto_filtrado, depto_seleccionado)
+    
+    st.plotly_chart(fig_depto, use_container_width=True, config=CONFIG_GRAFICOS)
+
 st.header('¿Cómo ha variado la tasa de suicidio en los últimos años?')
 
 with st.container(border=True):
@@ -377,27 +703,9 @@ with st.container(border=True):
 
 with st.container(border=True):
     # Gráfico de evolución temporal completo
-    fig_temporal = go.Figure()
+    fig_temporal = construir_fig_temporal(df_temporal)
     
-    fig_temporal.add_trace(go.Scatter(
-        x=df_temporal['Año del hecho'],
-        y=df_temporal['Cantidad'],
-        mode='lines+markers',
-        line=dict(color='#e74c3c', width=3),
-        marker=dict(size=10),
-        name='Casos por año',
-        hovertemplate='<b>Año %{x}</b><br>Casos: %{y}<extra></extra>'
-    ))
-    
-    fig_temporal.update_layout(
-        title='Evolución Temporal de Casos de Suicidio (2015-2024)',
-        xaxis_title='Año',
-        yaxis_title='Número de Casos',
-        height=400,
-        hovermode='x unified'
-    )
-    
-    st.plotly_chart(fig_temporal, use_container_width=True)
+    st.plotly_chart(fig_temporal, use_container_width=True, config=CONFIG_GRAFICOS)
 
        # Calcular tendencia
     casos_inicial = df_temporal.iloc[0]['Cantidad']
@@ -418,37 +726,8 @@ with st.container(border=True):
     """)
 
     
-    # Análisis por departamento
-    st.subheader('Comportamiento por Departamento')
-    
-    depto_seleccionado = st.selectbox(
-        'Seleccione un Departamento:',
-        options=lista_deptos,
-        index=lista_deptos.index('Antioquia') if 'Antioquia' in lista_deptos else 0
-    )
-    
-    df_depto_filtrado = df_depto_anio[df_depto_anio['Departamento del hecho DANE'] == depto_seleccionado]
-    
-    fig_depto = go.Figure()
-    
-    fig_depto.add_trace(go.Bar(
-        x=df_depto_filtrado['Año del hecho'],
-        y=df_depto_filtrado['Cantidad'],
-        marker_color='#3498db',
-        text=df_depto_filtrado['Cantidad'],
-        textposition='auto',
-        hovertemplate='<b>%{x}</b><br>Casos: %{y}<extra></extra>'
-    ))
-    
-    fig_depto.update_layout(
-        title=f'Evolución en {depto_seleccionado}',
-        xaxis_title='Año',
-        yaxis_title='Número de Casos',
-        height=400,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig_depto, use_container_width=True)
+    # Análisis por departamento (fragmento: el selector solo recarga esta sección)
+    seccion_departamento(depto_anio_por_depto, lista_deptos)
 
 ##############  PREGUNTA 4: ESCENARIOS Y MECANISMOS  ##############
 
@@ -460,52 +739,16 @@ with st.container(border=True):
     with col1:
         st.subheader('Escenarios más frecuentes')
         
-        fig_escenario = go.Figure()
-        
-        fig_escenario.add_trace(go.Bar(
-            y=df_escenario['Escenario'],
-            x=df_escenario['Cantidad'],
-            orientation='h',
-            text=df_escenario['Cantidad'],
-            textposition='auto',
-            marker_color='#2ecc71',
-            hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
-        ))
-        
-        fig_escenario.update_layout(
-            xaxis_title='Número de Casos',
-            yaxis_title='',
-            height=500,
-            yaxis={'categoryorder': 'total ascending'},
-            showlegend=False
-        )
+        fig_escenario = construir_fig_escenario(df_escenario)
         
-        st.plotly_chart(fig_escenario, use_container_width=True)
+        st.plotly_chart(fig_escenario, use_container_width=True, config=CONFIG_GRAFICOS)
     
     with col2:
         st.subheader('Mecanismos más utilizados')
         
-        fig_mecanismo = go.Figure()
-        
-        fig_mecanismo.add_trace(go.Bar(
-            y=df_mecanismo['Mecanismo'],
-            x=df_mecanismo['Cantidad'],
-            orientation='h',
-            text=df_mecanismo['Cantidad'],
-            textposition='auto',
-            marker_color='#e67e22',
-            hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
-        ))
-        
-        fig_mecanismo.update_layout(
-            xaxis_title='Número de Casos',
-            yaxis_title='',
-            height=500,
-            yaxis={'categoryorder': 'total ascending'},
-            showlegend=False
-        )
+        fig_mecanismo = construir_fig_mecanismo(df_mecanismo)
         
-        st.plotly_chart(fig_mecanismo, use_container_width=True)
+        st.plotly_chart(fig_mecanismo, use_container_width=True, config=CONFIG_GRAFICOS)
     
     # Hallazgos
     escenario_principal = df_escenario.iloc[0]['Escenario']
@@ -523,169 +766,103 @@ with st.container(border=True):
  
 ##############  PREGUNTA 5: RAZONES/MOTIVOS  ##############
 
-st.header('¿Cuáles son los principales factores o motivos asociados a los casos?')
-
-with st.container(border=True):
-    col1, col2 = st.columns([3, 2])
-    
-    with col2:
-        st.subheader('Filtros de Análisis')
+@st.fragment
+def seccion_razones(conteos_razones, mascaras_ciclo, mascaras_genero, lista_ciclos):
+    with st.container(border=True):
+        col1, col2 = st.columns([3, 2])
         
-        # Opción para incluir o excluir "Sin información"
-        incluir_sin_info = st.checkbox('Incluir casos "Sin información"', value=False)
+        with col2:
+            st.subheader('Filtros de Análisis')
+            
+            # Opción para incluir o excluir "Sin información"
+            incluir_sin_info = st.checkbox('Incluir casos "Sin información"', value=False)
+            
+            # Filtro por ciclo vital
+            ciclo_seleccionado = st.selectbox(
+                'Filtrar por Ciclo Vital:',
+                options=['Todos'] + lista_ciclos
+            )
+            
+            # Filtro por género
+            genero_seleccionado = st.selectbox(
+                'Filtrar por Género:',
+                options=['Todos', 'Hombre', 'Mujer']
+            )
         
-        # Filtro por ciclo vital
-        ciclo_seleccionado = st.selectbox(
-            'Filtrar por Ciclo Vital:',
-            options=['Todos'] + sorted(df['Ciclo Vital'].unique())
-        )
+        # APLICAR FILTROS SOBRE LOS CONTEOS PRECALCULADOS
+        # Las máscaras precalculadas solo se combinan si hay filtros activos
+        mascara = None
         
-        # Filtro por género
-        genero_seleccionado = st.selectbox(
-            'Filtrar por Género:',
-            options=['Todos', 'Hombre', 'Mujer']
-        )
-    
-    # APLICAR FILTROS AL DATAFRAME
-    df_filtrado = df.copy()
-    
-    if ciclo_seleccionado != 'Todos':
-        df_filtrado = df_filtrado[df_filtrado['Ciclo Vital'] == ciclo_seleccionado]
-    
-    if genero_seleccionado != 'Todos':
-        df_filtrado = df_filtrado[df_filtrado['Sexo de la victima'] == genero_seleccionado]
-    
-    # CALCULAR RAZONES SEGÚN FILTROS
-    if incluir_sin_info:
-        df_razones_dinamico = df_filtrado['Razon del Suicidio'].value_counts().head(10).reset_index()
-    else:
-        df_razones_dinamico = df_filtrado[df_filtrado['Razon del Suicidio'] != 'Sin informacion']['Razon del Suicidio'].value_counts().head(10).reset_index()
-    
-    df_razones_dinamico.columns = ['Razón', 'Cantidad']
-    
-    with col1:
-        st.subheader('Top 10 Razones Asociadas al Suicidio')
+        if ciclo_seleccionado != 'Todos':
+            mascara = mascaras_ciclo[ciclo_seleccionado]
         
-        # GRÁFICO DINÁMICO QUE SE ACTUALIZA CON LOS FILTROS
-        fig_razones = go.Figure()
+        if genero_seleccionado != 'Todos':
+            mascara_genero = mascaras_genero[genero_seleccionado]
+            mascara = mascara_genero if mascara is None else (mascara & mascara_genero)
         
-        fig_razones.add_trace(go.Bar(
-            y=df_razones_dinamico['Razón'],
-            x=df_razones_dinamico['Cantidad'],
-            orientation='h',
-            text=df_razones_dinamico['Cantidad'],
-            textposition='auto',
-            marker_color='#9b59b6',
-            hovertemplate='<b>%{y}</b><br>Casos: %{x}<extra></extra>'
-        ))
+        conteos_filtrados = conteos_razones if mascara is None else conteos_razones[mascara]
         
-        fig_razones.update_layout(
-            xaxis_title='Número de Casos',
-            yaxis_title='',
-            height=500,
-            yaxis={'categoryorder': 'total ascending'},
-            showlegend=False
-        )
+        # CALCULAR RAZONES SEGÚN FILTROS
+        razones_filtradas = conteos_filtrados.groupby(level='Razon del Suicidio', observed=True).sum()
         
-        st.plotly_chart(fig_razones, use_container_width=True)
-    
-    with col2:
-        st.markdown("---")
-        st.markdown("**Top 5 Razones (según filtros):**")
+        if not incluir_sin_info:
+            razones_filtradas = razones_filtradas.drop('Sin informacion', errors='ignore')
         
-        # Mostrar top 5 en métricas
-        top5 = df_razones_dinamico.head(5)
-        for idx, row in top5.iterrows():
-            st.metric(f"{idx+1}. {row['Razón']}", f"{row['Cantidad']} casos")
-    
-    # Hallazgo principal
-    if len(df_razones_dinamico) > 0:
-        razon_principal = df_razones_dinamico.iloc[0]['Razón']
-        casos_razon = df_razones_dinamico.iloc[0]['Cantidad']
+        df_razones_dinamico = razones_filtradas.nlargest(10).rename_axis('Razón').reset_index(name='Cantidad')
         
-        # Texto dinámico según filtros
-        filtro_texto = ""
-        if ciclo_seleccionado != 'Todos' or genero_seleccionado != 'Todos':
-            filtros_activos = []
-            if ciclo_seleccionado != 'Todos':
-                filtros_activos.append(f"ciclo vital: {ciclo_seleccionado}")
-            if genero_seleccionado != 'Todos':
-                filtros_activos.append(f"género: {genero_seleccionado}")
-            filtro_texto = f" (filtrado por {', '.join(filtros_activos)})"
+        with col1:
+            st.subheader('Top 10 Razones Asociadas al Suicidio')
+            
+            # GRÁFICO DINÁMICO QUE SE ACTUALIZA CON LOS FILTROS
+            fig_razones = construir_fig_razones(df_razones_dinamico, ciclo_seleccionado, genero_seleccionado, incluir_sin_info)
+            
+            st.plotly_chart(fig_razones, use_container_width=True, config=CONFIG_GRAFICOS)
         
-        st.info(f"""
-        **Hallazgo{filtro_texto}:** La razón más frecuente reportada es **"{razon_principal}"** 
-        con **{casos_razon:,}** casos. Es importante destacar que un porcentaje significativo 
-        de casos no tiene información sobre la razón del suicidio, lo que representa un desafío 
-        para las estrategias de prevención.
-        """)
-    else:
-        st.warning("No hay datos disponibles con los filtros seleccionados.")
+        with col2:
+            st.markdown("---")
+            st.markdown("**Top 5 Razones (según filtros):**")
+            
+            # Mostrar top 5 en métricas
+            top5 = df_razones_dinamico.head(5)
+            for i, (razon, cantidad) in enumerate(zip(top5['Razón'], top5['Cantidad']), start=1):
+                st.metric(f"{i}. {razon}", f"{cantidad} casos")
+        
+        # Hallazgo principal
+        if len(df_razones_dinamico) > 0:
+            razon_principal = df_razones_dinamico.iloc[0]['Razón']
+            casos_razon = df_razones_dinamico.iloc[0]['Cantidad']
+            
+            # Texto dinámico según filtros
+            filtro_texto = ""
+            if ciclo_seleccionado != 'Todos' or genero_seleccionado != 'Todos':
+                filtros_activos = []
+                if ciclo_seleccionado != 'Todos':
+                    filtros_activos.append(f"ciclo vital: {ciclo_seleccionado}")
+                if genero_seleccionado != 'Todos':
+                    filtros_activos.append(f"género: {genero_seleccionado}")
+                filtro_texto = f" (filtrado por {', '.join(filtros_activos)})"
+            
+            st.info(f"""
+            **Hallazgo{filtro_texto}:** La razón más frecuente reportada es **"{razon_principal}"** 
+            con **{casos_razon:,}** casos. Es importante destacar que un porcentaje significativo 
+            de casos no tiene información sobre la razón del suicidio, lo que representa un desafío 
+            para las estrategias de prevención.
+            """)
+        else:
+            st.warning("No hay datos disponibles con los filtros seleccionados.")
+
+st.header('¿Cuáles son los principales factores o motivos asociados a los casos?')
+
+# Fragmento: los filtros solo recargan esta sección
+seccion_razones(conteos_razones, mascaras_ciclo, mascaras_genero, lista_ciclos)
 
 ##############  CONCLUSIONES  ##############
 
 st.header('Conclusiones y Recomendaciones')
 
 with st.container(border=True):
-    st.markdown("""
-    ### Hallazgos Principales
-    
-    1. **Grupos más vulnerables:**
-       - Los adultos (29-59 años) representan el grupo etario con mayor número de casos
-       - Los hombres tienen una prevalencia 3.3 veces mayor que las mujeres
-    
-    2. **Tendencia temporal:**
-       - Se observa un incremento sostenido en el período 2015-2024
-       - Los años recientes (2022-2024) muestran los valores más altos del período analizado
-    
-    3. **Patrones de ocurrencia:**
-       - La vivienda es el escenario más frecuente de los casos
-       - Los generadores de asfixia constituyen el mecanismo más utilizado
-    
-    4. **Factores asociados:**
-       - Los conflictos de pareja y las enfermedades mentales son los motivos más reportados
-       - Existe una alta proporción de casos sin información sobre la razón (desafío para prevención)
-    
-    ### Recomendaciones
-    
-    1. **Fortalecimiento de sistemas de información:** Mejorar el registro de información sobre 
-       las razones asociadas a cada caso
-    
-    2. **Programas de prevención focalizados:** Diseñar estrategias específicas para hombres adultos 
-       y jóvenes, que son los grupos más vulnerables
-    
-    3. **Atención en salud mental:** Fortalecer los servicios de atención psicológica y psiquiátrica, 
-       especialmente en casos de conflictos de pareja y enfermedades mentales
-    
-    4. **Vigilancia epidemiológica:** Mantener sistemas de monitoreo continuo que permitan detectar 
-       cambios en las tendencias y patrones
-    
-    5. **Intervención en crisis:** Implementar líneas de atención telefónica y servicios de 
-       intervención en crisis disponibles 24/7
-    
-    ### Limitaciones del Estudio
-    
-    - El 43% de los registros originales fueron excluidos por falta de información completa
-    - La alta proporción de casos "sin información" en la razón del suicidio limita el análisis causal
-    - Los datos corresponden a casos reportados oficialmente, pudiendo existir subregistro
-    
-    ### Recursos de Ayuda
-    
-    **Si tú o alguien que conoces está atravesando una crisis:**
-    - 📞 Línea Nacional: 106 (Línea de atención en salud mental)
-    - 📞 Línea de la Vida: 01 8000 113 113
-    """)
+    st.markdown(CONCLUSIONES_MD)
 
 
 # Footer
-st.markdown("""
-<div style='text-align: center; color: #7f8c8d; padding: 20px;'>
-    <p>Dashboard desarrollado para análisis epidemiológico de suicidios en Colombia</p>
-    <p>Datos: 2015-2024 | Fuente: Instituto Nacional de Medicina Legal y Ciencias Forenses</p>
-    <p><em>Este análisis tiene fines académicos y de investigación en salud pública</em></p>
-    <p>Integrantes del Equipo:</p>
-    <p><em>* Mauricio Urrego Ospina</em></p>
-    <p><em>* Juliana Andrea Urrego Madrid</em></p>
-    <p><em>* Paula Andrea Gallego Higinio</em></p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.html(PIE_DE_PAGINA_HTML)
\ No newline at end of file
@@ -0,0 +1,22 @@
+import pandas as pd
+
+################################################
+###### CONVERSIÓN ÚNICA DEL CSV A PARQUET ######
+################################################
+# El dashboard lee el archivo Parquet (columnar y comprimido), que carga mucho
+# más rápido que el CSV. Ejecutar de nuevo si se actualiza el CSV original:
+#     python convertir_a_parquet.py
+columnas = ['Año del hecho', 'Ciclo Vital', 'Sexo de la victima', 'Pais de Nacimiento',
+            'Departamento del hecho DANE', 'Escenario del Hecho',
+            'Mecanismo Causal de la Lesion Fatal', 'Razon del Suicidio']
+
+# Los tipos se fijan en la lectura y quedan guardados en el Parquet: texto como
+# categorías y el año como entero (con nulos, que se eliminan al cargar los datos).
+# Las columnas de texto tienen pocos valores distintos, por lo que se prefieren
+# categorías a cadenas de PyArrow; PyArrow se usa como motor de lectura del CSV
+tipos = {col: 'category' for col in columnas if col != 'Año del hecho'}
+tipos['Año del hecho'] = 'Int32'
+
+df = pd.read_csv('./data/PresuntosSuicidios.csv', encoding='utf-8-sig',
+                 usecols=columnas, dtype=tipos, engine='pyarrow')
+df.to_parquet('./data/PresuntosSuicidios.parquet', compression='snappy', index=False)